@@ -1,5 +1,13 @@
-from configuration_manager import ConfigurationManagerCreator, YamlConfigurationManager, JsonConfigurationManager
+import configuration_manager
+from configuration_manager import ConfigurationManagerCreator, YamlConfigurationManager, JsonConfigurationManager, \
+    DatabaseReader
+from datetime import date
+import json
+import os
+import sqlite3
+import tempfile
 import unittest
+import yaml
 
 
 class TestConfigurationManager(unittest.TestCase):
@@ -69,6 +77,158 @@ class TestYamlConfigurationManager(unittest.TestCase):
 
         self.assertEqual(date, data['start_date'])
 
+    def test_cached_configs(self):
+        """
+        Test that an unchanged file is parsed once and shared between instances.
+        """
+        other = ConfigurationManagerCreator.create("example.yml", None)
+
+        self.assertIs(other.configs, self.source_yml.configs)
+
+    def test_read_memoized(self):
+        """
+        Test that read returns the already loaded configuration instead of parsing again.
+        """
+        self.assertIs(self.source_yml.read(), self.source_yml.configs)
+
+    def test_read_json_cache(self):
+        """
+        Test that reading from the json sidecar cache gives the same data, with the same types, as parsing
+        the YAML file.
+        """
+        with open("example.yml", "rb") as f:
+            content = f.read()
+
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "config.yml")
+            with open(source, "wb") as f:
+                f.write(content)
+
+            manager = YamlConfigurationManager(source)
+            cached = manager._load()
+
+            self.assertTrue(os.path.exists(source + ".cache.json"))
+
+        parsed = yaml.safe_load(content)
+
+        self.assertEqual(cached, parsed)
+        self.assertIs(type(cached['start_date']), type(parsed['start_date']))
+
+    def test_read_json_cache_types(self):
+        """
+        Test that the json sidecar cache restores the dates YAML parsed and leaves quoted dates as strings.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "config.yml")
+            with open(source, "w") as f:
+                f.write("start_date: '2015-12-30'\ndata_sizes:\n- 2015-12-30\n")
+
+            manager = YamlConfigurationManager(source)
+            cached = manager._load()
+
+        self.assertEqual(cached, manager.configs)
+        self.assertEqual(cached['start_date'], '2015-12-30')
+
+    def test_read_json_cache_stale_keys(self):
+        """
+        Test that a json sidecar cache written for other configuration keys is ignored.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "config.yml")
+            with open(source, "w") as f:
+                f.write("start_date: 2015-12-30\nfrequencies:\n- 1D\n")
+            manager = YamlConfigurationManager(source)
+
+            with open(source + ".cache.json") as f:
+                cache = json.load(f)
+            cache['keys'] = ['start_date']
+            cache['data'] = {'start_date': {'__date__': '2015-12-30'}}
+            with open(source + ".cache.json", "w") as f:
+                json.dump(cache, f)
+
+            data = manager._load()
+
+        self.assertEqual(data['frequencies'], ['1D'])
+
+    def test_read_json_cache_old_layout(self):
+        """
+        Test that a json sidecar cache in an older layout is ignored even when it is newer than the YAML file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "config.yml")
+            with open(source, "w") as f:
+                f.write("start_date: 2015-12-30\nfrequencies:\n- 1D\n")
+            with open(source + ".cache.json", "w") as f:
+                json.dump({"keys": sorted(configuration_manager._CONFIG_KEYS),
+                           "data": {"start_date": "2015-12-30", "frequencies": ["1D"]}}, f)
+
+            data = YamlConfigurationManager(source).read()
+
+        self.assertEqual(data['start_date'], date(2015, 12, 30))
+
+    def test_read_json_cache_modified_source(self):
+        """
+        Test that the json sidecar cache is ignored once the YAML file changed.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "config.yml")
+            with open(source, "w") as f:
+                f.write("start_date: 2015-12-30\nfrequencies:\n- 1D\n")
+            manager = YamlConfigurationManager(source)
+
+            with open(source, "w") as f:
+                f.write("start_date: 2015-12-30\nfrequencies:\n- 1H\n")
+            os.utime(source, ns=(0, 0))
+
+            data = manager._load()
+
+        self.assertEqual(data['frequencies'], ['1H'])
+
+    def test_read_json_cache_unreadable(self):
+        """
+        Test that a truncated json sidecar cache is ignored and replaced.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "config.yml")
+            with open(source, "w") as f:
+                f.write("start_date: 2015-12-30\nfrequencies:\n- 1D\n")
+            with open(source + ".cache.json", "w") as f:
+                f.write('{"keys": ["start_date"], "data": {"start_da')
+
+            manager = YamlConfigurationManager(source)
+            data = manager._load()
+
+        self.assertEqual(data, {'start_date': date(2015, 12, 30), 'frequencies': ['1D']})
+
+    def test_read_json_cache_unsupported_value(self):
+        """
+        Test that data json cannot hold, such as a set, is not cached and reads the same every time.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "config.yml")
+            with open(source, "w") as f:
+                f.write("start_date: 2015-12-30\ndata_sizes: !!set {60: null, 90: null}\n")
+
+            manager = YamlConfigurationManager(source)
+            data = manager._load()
+
+            self.assertEqual(os.listdir(directory), ["config.yml"])
+
+        self.assertEqual(data['data_sizes'], {60, 90})
+
+    def test_read_skips_unknown_keys(self):
+        """
+        Test that only the keys exposed by the configuration manager are loaded from a YAML source.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "config.yml")
+            with open(source, "w") as f:
+                f.write("start_date: 2015-12-30\nunused:\n  nested: [1, 2]\nfrequencies:\n- 1D\n")
+
+            data = ConfigurationManagerCreator.create(source).read()
+
+        self.assertEqual(set(data), {'start_date', 'frequencies'})
+
 
 class TestJsonConfigurationManager(unittest.TestCase):
     """
@@ -101,5 +261,66 @@ class TestJsonConfigurationManager(unittest.TestCase):
         self.assertEqual(date, data['start_date'])
 
 
+class TestDatabaseReader(unittest.TestCase):
+    """
+    Unit tests for the DatabaseReader class.
+
+    These tests build a small simulator database and verify the configuration data read from it.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test environment by creating a temporary database with one simulator and two configurations.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.source = os.path.join(self.directory.name, "db.sqlite3")
+
+        conn = sqlite3.connect(self.source)
+        conn.executescript("""
+            CREATE TABLE simulator_api_simulator (process_id INTEGER, name TEXT);
+            CREATE TABLE simulator_api_configuration (id INTEGER, simulator_id INTEGER, frequency TEXT,
+                noise_level REAL, trend_coefficients TEXT, cycle_component_frequency TEXT,
+                outlier_percentage REAL);
+            CREATE TABLE simulator_api_seasonalitycomponentdetails (id INTEGER, config_id INTEGER,
+                frequency_type TEXT);
+            INSERT INTO simulator_api_simulator VALUES (7, 'sim');
+            INSERT INTO simulator_api_configuration VALUES (1, 7, '1D', 0.1, 'exist', 'exist', 0.05);
+            INSERT INTO simulator_api_configuration VALUES (2, 7, '1H', 0.3, 'no', 'no', 0.0);
+            INSERT INTO simulator_api_seasonalitycomponentdetails VALUES (1, 1, 'Daily');
+            INSERT INTO simulator_api_seasonalitycomponentdetails VALUES (2, 2, 'Weekly');
+            INSERT INTO simulator_api_seasonalitycomponentdetails VALUES (3, 2, 'Daily');
+        """)
+        conn.commit()
+        conn.close()
+
+    def test_create_database(self):
+        """
+        Test the successful creation of a database reader instance.
+        """
+        reader = ConfigurationManagerCreator.create(self.source, "sim")
+        self.assertIsInstance(reader, DatabaseReader)
+
+    def test_read(self):
+        """
+        Test reading the configurations and their seasonality components from the database.
+        """
+        reader = ConfigurationManagerCreator.create(self.source, "sim")
+
+        self.assertEqual(reader.frequencies, ['1D', '1H'])
+        self.assertEqual(reader.noise_levels, [0.1, 0.3])
+        self.assertEqual([len(config['seasonality_components']) for config in reader.configs['configurations']],
+                         [1, 2])
+        self.assertEqual(reader.daily_seasonality_options, ["none", "exist"])
+        self.assertEqual(reader.weekly_seasonality_options, ["exist", "none"])
+
+    def test_read_unknown_simulator(self):
+        """
+        Test that no configuration is read for a simulator that is not in the database.
+        """
+        reader = ConfigurationManagerCreator.create(self.source, "other")
+        self.assertIsNone(reader.configs)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,11 @@
+import csv
 import os.path
+import tempfile
 import unittest
-from data_producer import DataProducerFileCreation, CsvDataProducer
+import data_producer
+from data_producer import DataProducerFileCreation, CsvDataProducer, ParquetDataProducer
+import numpy as np
 import pandas as pd
-from unittest.mock import patch
 
 
 class TestDataProducer(unittest.TestCase):
@@ -15,9 +18,11 @@ class TestDataProducer(unittest.TestCase):
 
     def setUp(self) -> None:
         """
-        Set up the test environment by defining the 'sink' attribute.
+        Set up the test environment by defining the 'sink' attribute inside a temporary directory.
         """
-        self.sink = 'sample_datasets/meta_data.csv'
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.sink = os.path.join(self.directory.name, 'sample_datasets', 'meta_data.csv')
 
     def test_create(self):
         """
@@ -40,24 +45,188 @@ class TestCsvDataProducer(unittest.TestCase):
         Set up the test environment by defining the 'sink' attribute, creating a sample data dictionary,
         and initializing a DataProducer instance.
         """
-        self.sink = 'sample_datasets/meta_data.csv'
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.sink = os.path.join(self.directory.name, 'sample_datasets', 'meta_data.csv')
         self.my_test_dict = {"test1": ["done"],
                              "test2": [132]
                              }
+        self.my_large_test_dict = {"test1": ["done"] * data_producer._SMALL_CSV_ROWS,
+                                   "test2": [132] * data_producer._SMALL_CSV_ROWS
+                                   }
 
         self.data_producer = DataProducerFileCreation.create(self.sink)
 
-    @patch('os.makedirs')
-    @patch('pandas.DataFrame.to_csv')
-    def test_produce(self, mock_to_csv, mock_mkdirs):
+    def test_produce(self):
         """
-        Test the successful production of a CSV file and validate its content.
+        Test the successful production of a small CSV file and validate its content.
         """
-        self.data_producer.produce(self.my_test_dict)
+        with tempfile.TemporaryDirectory() as directory:
+            sink = os.path.join(directory, 'meta_data.csv')
+            DataProducerFileCreation.create(sink).produce(self.my_test_dict)
 
-        mock_mkdirs.assert_called_once_with(os.path.dirname(self.sink), exist_ok=True)
+            with open(sink, 'rb') as f:
+                content = f.read()
 
-        mock_to_csv.assert_called_once_with(self.sink, encoding='utf-8', index=False)
+        self.assertEqual(content, b"test1,test2\ndone,132\n")
+
+    def test_produce_records(self):
+        """
+        Test the production of a small CSV file from a list of records with a missing value.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            sink = os.path.join(directory, 'meta_data.csv')
+            DataProducerFileCreation.create(sink).produce([{"test1": "done", "test2": float('nan')}])
+
+            with open(sink, 'rb') as f:
+                content = f.read()
+
+        self.assertEqual(content, b"test1,test2\ndone,\n")
+
+    def test_create_directory_once(self):
+        """
+        Test that producers sharing a sink directory only create it once.
+        """
+        makedirs_calls = []
+
+        original_makedirs = os.makedirs
+        os.makedirs = lambda *args, **kwargs: makedirs_calls.append((args, kwargs))
+        self.addCleanup(setattr, os, 'makedirs', original_makedirs)
+
+        directory = os.path.join(self.directory.name, 'series')
+        for counter in range(3):
+            DataProducerFileCreation.create(os.path.join(directory, f'{counter}.csv'))
+
+        self.assertEqual(makedirs_calls, [((directory,), {'exist_ok': True})])
+
+    def test_produce_pandas(self):
+        """
+        Test the successful production of a large CSV file through pandas, without creating the sink
+        directory the producer of setUp already created.
+        """
+        makedirs_calls = []
+        to_csv_calls = []
+
+        original_pa = data_producer.pa
+        data_producer.pa = None
+        self.addCleanup(setattr, data_producer, 'pa', original_pa)
+
+        original_makedirs = os.makedirs
+        original_to_csv = pd.DataFrame.to_csv
+        os.makedirs = lambda *args, **kwargs: makedirs_calls.append((args, kwargs))
+        pd.DataFrame.to_csv = lambda data_df, *args, **kwargs: to_csv_calls.append((args, kwargs))
+        self.addCleanup(setattr, os, 'makedirs', original_makedirs)
+        self.addCleanup(setattr, pd.DataFrame, 'to_csv', original_to_csv)
+
+        DataProducerFileCreation.create(self.sink).produce(self.my_large_test_dict)
+
+        self.assertEqual(makedirs_calls, [])
+
+        self.assertEqual(to_csv_calls, [((self.sink,), {'encoding': 'utf-8', 'index': False})])
+
+    @unittest.skipIf(data_producer.pa is None, "pyarrow is not installed")
+    def test_produce_pyarrow(self):
+        """
+        Test the content of the large CSV file written through PyArrow.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            sink = os.path.join(directory, 'meta_data.csv')
+            DataProducerFileCreation.create(sink).produce(self.my_large_test_dict)
+
+            with open(sink, newline='') as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(rows, [['test1', 'test2']] + [['done', '132']] * data_producer._SMALL_CSV_ROWS)
+
+    def test_produce_time_series_like_pandas(self):
+        """
+        Test that a time series is written exactly as pandas' to_csv writes it, on both sides of the
+        small file threshold and for daily as well as sub-daily timestamps.
+        """
+        for freq, size in [("D", 61), ("D", 150), ("6H", 61), ("6H", 150)]:
+            with self.subTest(freq=freq, size=size), tempfile.TemporaryDirectory() as directory:
+                value = np.linspace(-1, 2, size, dtype=np.float32)
+                value[3] = np.nan
+                data = {"value": value,
+                        "timestamp": pd.date_range("2021-07-01", periods=size, freq=freq),
+                        "anomaly": np.arange(size) % 7 == 0}
+
+                sink = os.path.join(directory, 'series.csv')
+                DataProducerFileCreation.create(sink).produce(data)
+                with open(sink, 'rb') as f:
+                    content = f.read()
+
+                self.assertEqual(content, pd.DataFrame(data).to_csv(index=False).encode('utf-8'))
+
+    def test_produce_records_like_pandas(self):
+        """
+        Test that a large list of records is written exactly as pandas' to_csv writes it.
+        """
+        records = [{"id": f"{i}.csv", "data_type": "additive, multiplicative", "data_size": 60,
+                    "percentage_outliers": 1.0 if i % 2 else 0.05} for i in range(data_producer._SMALL_CSV_ROWS)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            sink = os.path.join(directory, 'meta_data.csv')
+            DataProducerFileCreation.create(sink).produce(records)
+            with open(sink, 'rb') as f:
+                content = f.read()
+
+        self.assertEqual(content, pd.DataFrame(records).to_csv(index=False).encode('utf-8'))
+
+
+@unittest.skipIf(data_producer.pa is None, "pyarrow is not installed")
+class TestParquetDataProducer(unittest.TestCase):
+    """
+    Unit tests for the ParquetDataProducer class.
+
+    These tests verify that several time series produced to the same sink are appended to one Parquet file.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test environment by creating a temporary directory and a sample time series.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.sink = os.path.join(self.directory.name, 'series.parquet')
+        self.my_test_dict = {"timestamp": pd.date_range("2021-07-01", periods=3, freq="D"),
+                             "value": [0.5, float('nan'), -1.0],
+                             "anomaly": [False, False, True]
+                             }
+
+    def test_create(self):
+        """
+        Test the successful creation of a ParquetDataProducer instance.
+        """
+        with DataProducerFileCreation.create(self.sink) as data_producer_instance:
+            self.assertIsInstance(data_producer_instance, ParquetDataProducer)
+
+    def test_create_without_directory(self):
+        """
+        Test the creation of a ParquetDataProducer for a sink in the working directory.
+        """
+        cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        self.addCleanup(os.chdir, cwd)
+
+        with DataProducerFileCreation.create('series.parquet') as data_producer_instance:
+            data_producer_instance.produce(self.my_test_dict)
+
+        self.assertTrue(os.path.exists(self.sink))
+
+    def test_produce(self):
+        """
+        Test that every produced time series is appended to the Parquet file.
+        """
+        with DataProducerFileCreation.create(self.sink) as data_producer_instance:
+            data_producer_instance.produce(self.my_test_dict)
+            data_producer_instance.produce({**self.my_test_dict, 'id': '2'})
+
+        table = data_producer.pa_parquet.read_table(self.sink)
+
+        self.assertEqual(table.num_rows, 6)
+        self.assertEqual(table.column('value').null_count, 2)
+        self.assertEqual(table.column('id').to_pylist(), [None] * 3 + ['2'] * 3)
 
 
 if __name__ == '__main__':
@@ -1,55 +1,170 @@
+import os
+import tempfile
 import unittest
-from datetime import datetime
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from functools import partial
+from itertools import product
 import random
-from unittest.mock import MagicMock
+import numpy as np
 import pandas as pd
 
-from data_simulator import DataGenerator, TimeSeriesGenerator, WeeklySeasonality, DailySeasonality
+import data_simulator
+from data_simulator import DataGenerator, TimeSeriesGenerator, WeeklySeasonality, DailySeasonality, Outliers, \
+    MissingValues
 
-from configuration_manager import ConfigurationManager
+
+def _write_size(directory, data, meta_data_point):
+    """
+    Stands in for a producer: writes the number of values of a series to a file named after its id.
+    Defined at module level so it can be sent to worker processes.
+    """
+    with open(os.path.join(directory, meta_data_point['id']), 'w') as f:
+        f.write(str(len(data['value'])))
 
 
-class TestDataGenerator(unittest.TestCase):
+@dataclass(frozen=True, slots=True)
+class FakeConfig:
     """
-    Unit tests for the DataSimulator class.
+    An immutable stand-in for ConfigurationManager exposing only the properties DataGenerator reads.
+    """
+    start_date: datetime = datetime(2021, 7, 1)
+    frequencies: tuple = ("1D",)
+    daily_seasonality_options: tuple = ("exist",)
+    weekly_seasonality_options: tuple = ("exist",)
+    noise_levels: tuple = ("small",)
+    trend_levels: tuple = ("exist",)
+    cyclic_periods: tuple = ("exist",)
+    data_types: tuple = ("additive",)
+    percentage_outliers_options: tuple = (0.05,)
+    data_sizes: tuple = (60,)
 
-    These tests verify various aspects of the DataSimulator class, including data generation,
-    time series generation, and the addition of seasonality components.
+
+FAKE_CONFIG = FakeConfig()
+
+
+class _SimFixture:
     """
+    Shared configuration options for the DataSimulator tests.
 
-    def setUp(self) -> None:
+    Kept free of test methods so the test classes mixing it in do not re-run each other's tests.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Set up the test environment by defining configuration options, initializing a DataSimulator instance,
-        and creating a mock ConfigurationManager.
+        Set up the test environment once per class by defining configuration options, initializing a
+        DataSimulator instance, and using a shared fake ConfigurationManager.
         """
-        self.start_date = datetime(2021, 7, 1)
-        self.end_date = datetime(2021, 10, 2)
-        self.frequencies = ["1D", "10T", "30T", "1H", "6H", "8H"]
-        self.daily_seasonality_options = ["no", "exist"]
-        self.weekly_seasonality_options = ["exist", "no"]
-        self.noise_levels = ["small"]  # , "large"]
-        self.trend_levels = ["exist", "no"]
-        self.cyclic_periods = ["exist", "no"]
-        self.data_types = [""
-                           "", "additive"]
-        self.percentage_outliers_options = [0.05]  # , 0]
-        self.data_sizes = [60, 90, 120, 150, 180, 210, 240, 270, 300, 330, 365]
+        cls.start_date = datetime(2021, 7, 1)
+        cls.end_date = datetime(2021, 10, 2)
+        cls.frequencies = ("1D", "10T", "30T", "1H", "6H", "8H")
+        cls.daily_seasonality_options = ("no", "exist")
+        cls.weekly_seasonality_options = ("exist", "no")
+        cls.noise_levels = ("small",)  # , "large")
+        cls.trend_levels = ("exist", "no")
+        cls.cyclic_periods = ("exist", "no")
+        cls.data_types = ("", "additive")
+        cls.percentage_outliers_options = (0.05,)  # , 0)
+        cls.data_sizes = (60, 90, 120, 150, 180, 210, 240, 270, 300, 330, 365)
+
+        # a dedicated seeded generator keeps the pick reproducible without touching the global random state
+        cls.freq = random.Random(0).choice(cls.frequencies)
+
+        cls.data_simulator_instance = DataGenerator(FAKE_CONFIG)
+
 
-        self.freq = random.choice(self.frequencies)
+class TestDataGenerator(_SimFixture, unittest.TestCase):
+    """
+    Unit tests for the DataSimulator class.
 
-        self.configuration_mock = MagicMock(spec=ConfigurationManager)
-        self.data_simulator_instance = DataGenerator(self.configuration_mock)
+    These tests verify the data generation of the DataSimulator class.
+    """
 
     def test_generate(self):
         """
         Test the data generation method to ensure it yields tuples.
+
+        Each frequency and data size combination runs as its own subtest so a failure names the
+        combination that caused it. Only the two shortest data sizes are used to keep the test fast.
+        """
+        for freq, data_size in product(self.frequencies, self.data_sizes[:2]):
+            with self.subTest(freq=freq, data_size=data_size):
+                config = replace(FAKE_CONFIG, frequencies=(freq,), data_sizes=(data_size,))
+                for i in DataGenerator(config).generate():
+                    self.assertIsInstance(i, tuple)
+
+    def test_len(self):
+        """
+        Test that the length of the generator is the number of series it generates.
+        """
+        config = replace(FAKE_CONFIG, trend_levels=("exist", "no"))
+        self.assertEqual(len(DataGenerator(config)), 32)
+        self.assertEqual(len(list(DataGenerator(config).generate())), 32)
+
+    def test_generate_parallel(self):
+        """
+        Test that generating in worker processes yields every series in order.
+        """
+        meta_data = [meta_data_point for _, meta_data_point in DataGenerator(FAKE_CONFIG, n_jobs=2).generate()]
+
+        self.assertEqual([meta_data_point['id'] for meta_data_point in meta_data],
+                         [str(counter) for counter in range(1, 17)])
+
+    def test_produce(self):
+        """
+        Test that every series is handed to write, in this process and in worker processes, and that only
+        the metadata is yielded, in order.
+        """
+        for n_jobs in (1, 2):
+            with self.subTest(n_jobs=n_jobs), tempfile.TemporaryDirectory() as directory:
+                meta_data = list(DataGenerator(FAKE_CONFIG, n_jobs=n_jobs).produce(partial(_write_size, directory)))
+
+                self.assertEqual([meta_data_point['id'] for meta_data_point in meta_data],
+                                 [str(counter) for counter in range(1, 17)])
+                self.assertEqual(sorted(os.listdir(directory)), sorted(str(counter) for counter in range(1, 17)))
+
+    def test_finalize(self):
+        """
+        Test that every series of a batch gets its share of outliers and missing values.
+        """
+        rng = np.random.default_rng(0)
+        for percentage_outliers in (0.05, 0):
+            with self.subTest(percentage_outliers=percentage_outliers):
+                data = np.zeros((4, 1000), dtype=np.float32)
+                anomalies = DataGenerator._finalize(data, percentage_outliers, 0.05, rng)
+
+                np.testing.assert_array_equal(anomalies.sum(axis=1), int(1000 * percentage_outliers))
+                np.testing.assert_array_equal(np.isnan(data).sum(axis=1), int(1000 * 0.05))
+
+
+class TestSampleIndices(unittest.TestCase):
+
+    def test_sample_indices(self):
         """
-        data_generator = self.data_simulator_instance.generate()
-        for i in data_generator:
-            self.assertIsInstance(i, tuple)
+        Test that k distinct indices are drawn per series, including for k = 0 and k = n.
+        """
+        rng = np.random.default_rng(0)
+        for k in (0, 1, 50, 1000):
+            with self.subTest(k=k):
+                indices = data_simulator._sample_indices(rng, (4, 1000), k)
+
+                self.assertEqual(indices.shape, (4, k))
+                for row in indices:
+                    self.assertEqual(len(np.unique(row)), k)
+                    self.assertTrue(((row >= 0) & (row < 1000)).all())
+
+    def test_sample_indices_1d(self):
+        """
+        Test that drawing from a single series gives a 1-D array of indices.
+        """
+        indices = data_simulator._sample_indices(np.random.default_rng(0), 100, 5)
+
+        self.assertEqual(indices.shape, (5,))
+        self.assertEqual(len(np.unique(indices)), 5)
 
 
-class TestGenerateTimeSeries(TestDataGenerator, unittest.TestCase):
+class TestGenerateTimeSeries(_SimFixture, unittest.TestCase):
 
     def test_generate_time_series(self):
         """
@@ -59,7 +174,28 @@ class TestGenerateTimeSeries(TestDataGenerator, unittest.TestCase):
         self.assertIsInstance(date, pd.DatetimeIndex)
 
 
-class TestWeeklySeasonality(TestDataGenerator, unittest.TestCase):
+class TestTimeComponents(_SimFixture, unittest.TestCase):
+
+    def test_sliced_time_components(self):
+        """
+        Test that an index sliced out of a longer one equals the index generated for its own end date,
+        for every frequency and for date as well as datetime start dates.
+        """
+        for start_date in (date(2021, 7, 1), datetime(2021, 7, 1, 3)):
+            base_end_date = start_date + timedelta(days=max(self.data_sizes))
+            for freq, data_size in product(self.frequencies, self.data_sizes[:3] + self.data_sizes[-1:]):
+                with self.subTest(start_date=start_date, freq=freq, data_size=data_size):
+                    end_date = start_date + timedelta(days=data_size)
+                    components = TimeSeriesGenerator.time_components(start_date, end_date, freq, base_end_date)
+                    expected = pd.date_range(start_date, end_date, freq=freq)
+
+                    self.assertTrue(components.index.equals(expected))
+                    np.testing.assert_array_equal(components.hour, expected.hour)
+                    np.testing.assert_array_equal(components.dayofweek, expected.dayofweek)
+                    np.testing.assert_array_equal(components.quarter, expected.quarter)
+
+
+class TestWeeklySeasonality(_SimFixture, unittest.TestCase):
 
 
     def test_add_weekly_seasonality(self):
@@ -68,13 +204,22 @@ class TestWeeklySeasonality(TestDataGenerator, unittest.TestCase):
         """
         self.weekly_seasonality_instance = WeeklySeasonality()
         date = TimeSeriesGenerator.generate_time_series(self.start_date, self.end_date, self.freq)
-        weekly_seasonality = self.weekly_seasonality_instance.add_seasonality(date, self.weekly_seasonality_options,
-                                                                              self.data_types)
+        weekly_seasonality = self.weekly_seasonality_instance.add_seasonality(date, "exist", "additive")
 
-        self.assertIsInstance(weekly_seasonality, pd.Series)
+        self.assertIsInstance(weekly_seasonality, np.ndarray)
+        self.assertEqual(len(weekly_seasonality), len(date))
 
+    def test_add_no_weekly_seasonality(self):
+        """
+        Test that a missing weekly seasonality is the identity scalar of the data type.
+        """
+        date = TimeSeriesGenerator.generate_time_series(self.start_date, self.end_date, self.freq)
+
+        self.assertEqual(WeeklySeasonality().add_seasonality(date, "no", "additive"), 0)
+        self.assertEqual(WeeklySeasonality().add_seasonality(date, "no", "multiplicative"), 1)
 
-class TestDailySeasonality(TestDataGenerator, unittest.TestCase):
+
+class TestDailySeasonality(_SimFixture, unittest.TestCase):
 
     def test_add_daily_seasonality(self):
         """
@@ -82,9 +227,43 @@ class TestDailySeasonality(TestDataGenerator, unittest.TestCase):
         """
         self.daily_seasonality_instance = DailySeasonality()
         date = TimeSeriesGenerator.generate_time_series(self.start_date, self.end_date, self.freq)
-        daily_seasonality = self.daily_seasonality_instance.add_seasonality(date, self.weekly_seasonality_options,
-                                                                            self.data_types)
-        self.assertIsInstance(daily_seasonality, pd.Series)
+        daily_seasonality = self.daily_seasonality_instance.add_seasonality(date, "exist", "additive")
+
+        self.assertIsInstance(daily_seasonality, np.ndarray)
+        self.assertEqual(len(daily_seasonality), len(date))
+
+
+class TestOutliers(unittest.TestCase):
+
+    def test_add_outliers(self):
+        """
+        Test that outliers are written into a copy of the series unless inplace is set.
+        """
+        for inplace in (False, True):
+            with self.subTest(inplace=inplace):
+                data = np.full(100, 2, dtype=np.float32)
+                values, anomaly = Outliers.add_outliers(data, 0.05, rng=np.random.default_rng(0), inplace=inplace)
+
+                self.assertEqual(anomaly.sum(), 5)
+                self.assertTrue((np.abs(values[anomaly]) <= 1).all())
+                self.assertIs(values is data, inplace)
+                self.assertEqual((data != 2).sum(), 5 if inplace else 0)
+
+
+class TestMissingValues(unittest.TestCase):
+
+    def test_add_missing_values(self):
+        """
+        Test that missing values are written into a copy of the series unless inplace is set.
+        """
+        for inplace in (False, True):
+            with self.subTest(inplace=inplace):
+                data = np.zeros(100, dtype=np.float32)
+                values = MissingValues.add_missing_values(data, 0.05, rng=np.random.default_rng(0), inplace=inplace)
+
+                self.assertEqual(np.isnan(values).sum(), 5)
+                self.assertIs(values is data, inplace)
+                self.assertEqual(np.isnan(data).sum(), 5 if inplace else 0)
 
 
 if __name__ == '__main__':
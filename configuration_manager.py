@@ -1,9 +1,62 @@
-from abc import ABC, abstractmethod
+import os
 import sqlite3
 
-import yaml
-import json
-from datetime import datetime
+from collections import defaultdict
+from datetime import date, datetime
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+# bumped whenever the layout of the yaml sidecar cache changes
+_SIDECAR_VERSION = 1
+
+# parsed configurations keyed by (manager class, absolute path, modification time, size)
+# so unchanged files are parsed once per process
+_CONFIG_CACHE: dict[tuple[type, str, int, int], dict] = {}
+
+
+def _json_loads(raw: bytes):
+    """
+    Parses json data with orjson when it is installed and the json module otherwise.
+    The parser is imported on first use so managers that never read json do not load it.
+
+    Parameters:
+        raw: The json document
+
+    return:
+        data
+    """
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+
+    return loads(raw)
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader():
+    """
+    Builds the yaml loader class on first use, based on LibYAML's CSafeLoader when it is available.
+    Only the top-level keys exposed by ConfigurationManager are constructed, the sub-trees of any
+    other key are skipped.
+
+    return:
+        The loader class
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    class ConfigLoader(Loader):
+        def construct_document(self, node):
+            if isinstance(node, yaml.MappingNode):
+                node.value = [(key, value) for key, value in node.value
+                              if isinstance(key, yaml.ScalarNode) and key.value in _CONFIG_KEYS]
+            return super().construct_document(node)
+
+    return ConfigLoader
 
 
 class ConfigurationManagerCreator:
@@ -17,34 +70,45 @@ class ConfigurationManagerCreator:
         self.source = source
 
     @classmethod
-    def create(cls, source: str, simulator_name):
+    def create(cls, source: str, simulator_name=None):
         """
         Creates an instance from the chosen source.
 
         Parameters:
-            source: The source of the data. Can be yaml file or json file
+            source: The source of the data. Can be yaml file, json file or sqlite3 database
+            simulator_name: The simulator to read when the source is a database
 
+        Raises:
+            ValueError: If the source type is not supported.
         """
-        if source.endswith('.yml'):
-            return YamlConfigurationManager(source)
+        manager_cls = _REGISTRY.get(source.rpartition('.')[2].lower())
+        if manager_cls is None:
+            raise ValueError(f"Unsupported source: {source}")
 
-        elif source.endswith('.json'):
-            return JsonConfigurationManager(source)
+        if issubclass(manager_cls, DatabaseReader):
+            return manager_cls(source, simulator_name)
+        return manager_cls(source)
 
-        elif source.endswith('.sqlite3'):
-            return DatabaseReader(source, simulator_name)
+    @classmethod
+    def register(cls, extension: str, manager_cls):
+        """
+        Registers a configuration manager class for a file extension.
 
-        else:
-            raise Exception(f"Unsupported source: {source}")
+        Parameters:
+            extension: The file extension, with or without the leading dot (e.g. '.toml')
+            manager_cls: The ConfigurationManager subclass created for that extension
+        """
+        _REGISTRY[extension.lstrip('.').lower()] = manager_cls
 
 
-class ConfigurationManager(ABC):
+class ConfigurationManager:
     """
     An abstract class that provides a configuration manager framework.
     methods:
         __init__: Initializes the configuration manager instance.
         create: Factory method to create an instance of a specific configuration manager.
-        read: Abstract method for reading configuration data from a source.
+        read: Returns the configuration data, loading it on first use.
+        _load: Abstract method for loading configuration data from a source.
 
     """
 
@@ -56,13 +120,30 @@ class ConfigurationManager(ABC):
             source: The source of the data. Can be yaml file or json file
         """
         self.source = source
-        self.configs = self.read()
+        self.configs = None
+
+        stat = os.stat(source)
+        key = (type(self), os.path.abspath(source), stat.st_mtime_ns, stat.st_size)
+        if key not in _CONFIG_CACHE:
+            _CONFIG_CACHE[key] = self._load()
+        self.configs = _CONFIG_CACHE[key]
 
-    @abstractmethod
     def read(self):
-        pass
+        """
+        Gets the configuration data, loading it from the source only if it was not loaded yet
+
+        return:
+            data
+        """
+        if self.configs is None:
+            self.configs = self._load()
+
+        return self.configs
+
+    def _load(self):
+        raise NotImplementedError
 
-    @property
+    @cached_property
     def start_date(self):
         """
         Gets the start_date from the file
@@ -72,7 +153,7 @@ class ConfigurationManager(ABC):
         """
         return self.configs['start_date']
 
-    @property
+    @cached_property
     def frequencies(self):
         """
         Gets the frequencies from the file
@@ -82,7 +163,7 @@ class ConfigurationManager(ABC):
         """
         return self.configs['frequencies']
 
-    @property
+    @cached_property
     def daily_seasonality_options(self):
         """
         Gets the daily_seasonality_options from the file
@@ -92,7 +173,7 @@ class ConfigurationManager(ABC):
         """
         return self.configs['daily_seasonality_options']
 
-    @property
+    @cached_property
     def weekly_seasonality_options(self):
         """
         Gets the weekly_seasonality_options from the file
@@ -102,7 +183,7 @@ class ConfigurationManager(ABC):
         """
         return self.configs['weekly_seasonality_options']
 
-    @property
+    @cached_property
     def noise_levels(self):
         """
         Gets the noise_levels from the file
@@ -112,7 +193,7 @@ class ConfigurationManager(ABC):
         """
         return self.configs['noise_levels']
 
-    @property
+    @cached_property
     def trend_levels(self):
         """
         Gets the trend_levels from the file
@@ -122,7 +203,7 @@ class ConfigurationManager(ABC):
         """
         return self.configs['trend_levels']
 
-    @property
+    @cached_property
     def cyclic_periods(self):
         """
         Gets the cyclic_periods from the file
@@ -132,7 +213,7 @@ class ConfigurationManager(ABC):
         """
         return self.configs['cyclic_periods']
 
-    @property
+    @cached_property
     def data_types(self):
         """
         Gets the data_types from the file
@@ -142,7 +223,7 @@ class ConfigurationManager(ABC):
         """
         return self.configs['data_types']
 
-    @property
+    @cached_property
     def percentage_outliers_options(self):
         """
         Gets the percentage_outliers_options from the file
@@ -152,7 +233,7 @@ class ConfigurationManager(ABC):
         """
         return self.configs['percentage_outliers_options']
 
-    @property
+    @cached_property
     def data_sizes(self):
         """
         Gets the data_sizes from the file
@@ -163,43 +244,136 @@ class ConfigurationManager(ABC):
         return self.configs['data_sizes']
 
 
+# the configuration keys read through the ConfigurationManager properties
+_CONFIG_KEYS = frozenset(name for name, value in vars(ConfigurationManager).items()
+                         if isinstance(value, cached_property))
+
+
 class YamlConfigurationManager(ConfigurationManager):
     """
     Concrete class to implement the abstract class when it is yaml file
 
     methods:
-        read
+        _load
     """
 
-    def read(self):
+    def _load(self):
         """
         read yaml file
 
+        The parsed data is also written to a '<source>.cache.json' sidecar file, which is read
+        instead of the yaml file as long as it was written by this sidecar format for the same
+        configuration keys and for the current modification time and size of the yaml file.
+        Dates are tagged in the sidecar, so only the values yaml parsed as dates are converted back.
+        A sidecar that cannot be read is ignored, and data json cannot hold as parsed is not cached.
+
         return:
             data
         """
-        with open(self.source) as f:
-            data = yaml.safe_load(f)
+        cache_path = self.source + '.cache.json'
+        stat = os.stat(self.source)
+        header = {'version': _SIDECAR_VERSION, 'keys': sorted(_CONFIG_KEYS),
+                  'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+        try:
+            cache = _json_loads(Path(cache_path).read_bytes())
+            if isinstance(cache, dict) and 'data' in cache and all(cache.get(key) == value
+                                                                    for key, value in header.items()):
+                return self._restore_dates(cache['data'])
+        except (OSError, TypeError, ValueError):
+            pass
+
+        import json
+        import yaml
+
+        data = yaml.load(Path(self.source).read_bytes(), Loader=_yaml_loader())
+
+        try:
+            text = json.dumps({**header, 'data': data}, default=self._tag_date)
+            # json turns keys into strings and tuples into lists, so only data that reads back equal is cached
+            if self._restore_dates(json.loads(text)['data']) != data:
+                return data
+        except (TypeError, ValueError):
+            return data
+
+        # written to a temporary file first so a reader never sees a partly written sidecar
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
         return data
 
+    @staticmethod
+    def _tag_date(value):
+        """
+        Tags a date for the json cache. Any other value the json module cannot write is refused.
+
+        Parameters:
+            value: A value of the data the json module cannot write
+
+        Raises:
+            TypeError: If the value is not a date or datetime.
+
+        return:
+            The tagged date
+        """
+        if isinstance(value, date):
+            return {'__date__': value.isoformat()}
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    @classmethod
+    def _restore_dates(cls, value):
+        """
+        Converts the tagged dates of data read from the json cache back to dates.
+
+        Parameters:
+            value: The data, or a value nested in it
+
+        return:
+            The data with its dates restored
+        """
+        if isinstance(value, dict):
+            if value.keys() == {'__date__'}:
+                return cls._parse_date(value['__date__'])
+            return {key: cls._restore_dates(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._restore_dates(item) for item in value]
+        return value
+
+    @staticmethod
+    def _parse_date(date_str: str):
+        """
+        Restores a date written to the json cache back to the type yaml parsed it as.
+
+        Parameters:
+            date_str: The ISO formatted date or datetime
+
+        return:
+            date or datetime
+        """
+        if 'T' in date_str:
+            return datetime.fromisoformat(date_str)
+        return date.fromisoformat(date_str)
+
 
 class JsonConfigurationManager(ConfigurationManager):
-    def read(self):
+    def _load(self):
         """
         read json file
 
         return:
             data
         """
-        with open(self.source) as f:
-            jsondata = f.read()
-            data = json.loads(jsondata)
+        data = _json_loads(Path(self.source).read_bytes())
 
-            date_str = data['start_date']
-            date_format = '%Y-%m-%d'
-            date_obj = datetime.strptime(date_str, date_format)
-            data['start_date'] = date_obj
+        data['start_date'] = datetime.fromisoformat(data['start_date'])
 
         return data
 
@@ -208,11 +382,13 @@ class DatabaseReader(ConfigurationManager):
     def __init__(self, source, simulator_name):
         self.source = source
         self.simulator_name = simulator_name
-        self.configs = self.read()
+        self.configs = self._load()
 
-    def read(self):
+    def _load(self):
 
-        conn = sqlite3.connect(self.source)
+        conn = sqlite3.connect(self.source, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=1")
         cursor = conn.cursor()
 
         cursor.execute("SELECT * FROM simulator_api_simulator WHERE name=?", (self.simulator_name,))
@@ -223,35 +399,33 @@ class DatabaseReader(ConfigurationManager):
             conn.close()
             return
 
-        simulator_columns = [desc[0] for desc in cursor.description]
+        simulator_data = dict(simulator_row)
 
-        if simulator_columns is None:
-            cursor.close()
-            conn.close()
-            return
-        simulator_data = dict(zip(simulator_columns, simulator_row))
-
-        cursor.execute("SELECT * FROM simulator_api_configuration WHERE simulator_id=?",
+        cursor.execute("SELECT id, frequency, noise_level, trend_coefficients, cycle_component_frequency, "
+                       "outlier_percentage FROM simulator_api_configuration WHERE simulator_id=?",
                        (simulator_data['process_id'],))
-
         configurations_rows = cursor.fetchall()
 
-        configurations_columns = [desc[0] for desc in cursor.description]
-        configurations_data = [dict(zip(configurations_columns, row)) for row in configurations_rows]
+        frequencies = [row['frequency'] for row in configurations_rows]
+        noise_level = [row['noise_level'] for row in configurations_rows]
+        trends = [row['trend_coefficients'] for row in configurations_rows]
+        cycles = [row['cycle_component_frequency'] for row in configurations_rows]
+        outliers = [row['outlier_percentage'] for row in configurations_rows]
+
+        config_ids = [row['id'] for row in configurations_rows]
+        cursor.execute("SELECT * FROM simulator_api_seasonalitycomponentdetails "
+                       f"WHERE config_id IN ({','.join('?' * len(config_ids))})", config_ids)
 
-        frequencies = [config_data['frequency'] for config_data in configurations_data]
-        noise_level = [config_data['noise_level'] for config_data in configurations_data]
-        trends = [config_data['trend_coefficients'] for config_data in configurations_data]
-        cycles = [config_data['cycle_component_frequency'] for config_data in configurations_data]
-        outliers = [config_data['outlier_percentage'] for config_data in configurations_data]
+        seasonality_by_config = defaultdict(list)
+        for row in cursor.fetchall():
+            seasonality_by_config[row['config_id']].append(dict(row))
 
-        for config_data in configurations_data:
-            cursor.execute("SELECT * FROM simulator_api_seasonalitycomponentdetails WHERE config_id=?",
-                           (config_data['id'],))
-            seasonality_rows = cursor.fetchall()
+        daily_seasonality_options = []
+        weekly_seasonality_options = []
 
-            seasonality_columns = [desc[0] for desc in cursor.description]
-            seasonality_data = [dict(zip(seasonality_columns, row)) for row in seasonality_rows]
+        configurations_data = []
+        for row in configurations_rows:
+            seasonality_data = seasonality_by_config[row['id']]
 
             daily_seasonality_options = []
             weekly_seasonality_options = []
@@ -265,7 +439,7 @@ class DatabaseReader(ConfigurationManager):
                     daily_seasonality_options.append("none")
                     weekly_seasonality_options.append("exist")
 
-            config_data['seasonality_components'] = seasonality_data
+            configurations_data.append({**row, 'seasonality_components': seasonality_data})
         cursor.close()
         conn.close()
 
@@ -278,4 +452,12 @@ class DatabaseReader(ConfigurationManager):
         simulator_data['cyclic_periods'] = cycles
         simulator_data['percentage_outliers_options'] = outliers
 
-        return (simulator_data)
\ No newline at end of file
+        return (simulator_data)
+
+
+_REGISTRY = {
+    'yml': YamlConfigurationManager,
+    'yaml': YamlConfigurationManager,
+    'json': JsonConfigurationManager,
+    'sqlite3': DatabaseReader,
+}
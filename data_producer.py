@@ -1,7 +1,37 @@
 from abc import ABC, abstractmethod
+import csv
+import io
+import numpy as np
 import pandas as pd
 import os
 
+try:
+    import pyarrow as pa
+    from pyarrow import compute as pa_compute
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pa_parquet
+except ImportError:
+    pa = None
+
+# inputs with fewer rows than this are written with the csv module instead of building a table
+_SMALL_CSV_ROWS = 100
+
+# sink directories already created in this process, so producers sharing one only create it once
+_CREATED_DIRS = set()
+
+
+def _create_sink_dir(sink: str):
+    """
+    Creates the directory of a sink, unless it has no directory part or was already created in this process.
+
+    Parameters:
+        sink (str): The destination where data will be produced.
+    """
+    directory = os.path.dirname(sink)
+    if directory and directory not in _CREATED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _CREATED_DIRS.add(directory)
+
 
 class DataProducerFileCreation:
 
@@ -21,6 +51,8 @@ class DataProducerFileCreation:
         """
         if sink.endswith(".csv"):
             return CsvDataProducer(sink)
+        elif sink.endswith(".parquet"):
+            return ParquetDataProducer(sink)
         else:
             raise ValueError(f"Unsupported sink: {sink}")
 
@@ -48,17 +80,186 @@ class DataProducer(ABC):
 
 
 class CsvDataProducer(DataProducer):
+    def __init__(self, sink: str):
+        """
+        Initialize a CsvDataProducer instance and create the directory of its sink.
+
+        Parameters:
+            sink (str): The destination where data will be produced.
+        """
+        super().__init__(sink)
+        _create_sink_dir(sink)
+
     def produce(self, data: dict):
         """
         Produce data to the specified destination by saving it as a CSV file.
 
         This method takes a dictionary of data and saves it as a CSV file to the destination
-        specified during the object's initialization.
+        specified during the object's initialization. Small inputs are written directly with the
+        csv module, larger ones with PyArrow's CSV writer when it is installed and with pandas otherwise.
+        Every path writes the same text as pandas' to_csv.
 
         Parameters:
             data (dict): A dictionary containing the data to be saved to the CSV file.
 
         """
-        data_df = pd.DataFrame(data)
-        os.makedirs(os.path.dirname(self.sink), exist_ok=True)
-        data_df.to_csv(self.sink, encoding='utf-8', index=False)
\ No newline at end of file
+        if self._row_count(data) < _SMALL_CSV_ROWS:
+            self._write_rows(data)
+            return
+
+        if pa is None:
+            data_df = pd.DataFrame(data)
+            data_df.to_csv(self.sink, encoding='utf-8', index=False)
+            return
+
+        if isinstance(data, list):
+            table = pa.Table.from_pylist(data)
+        else:
+            # from_pandas makes NaN a null, written as an empty field like pandas does
+            table = pa.table({name: pa.array(column, from_pandas=True) for name, column in data.items()})
+
+        # pyarrow quotes every string, so the header is written with the csv module and the values,
+        # all formatted as pandas would, without quotes; a value that needs quoting falls back to pandas
+        header = io.StringIO()
+        csv.writer(header, lineterminator='\n').writerow(table.column_names)
+        try:
+            with open(self.sink, 'wb') as f:
+                f.write(header.getvalue().encode('utf-8'))
+                pa_csv.write_csv(self._format_like_pandas(table), f,
+                                 write_options=pa_csv.WriteOptions(include_header=False, quoting_style='none'))
+        except pa.ArrowInvalid:
+            pd.DataFrame(data).to_csv(self.sink, encoding='utf-8', index=False)
+
+    @staticmethod
+    def _format_like_pandas(table):
+        """
+        Converts the timestamp, boolean and floating point columns of a table to the text pandas' to_csv
+        writes for them, which differs from the one PyArrow's CSV writer uses.
+
+        Parameters:
+            table (pyarrow.Table): The data to be saved.
+
+        Returns:
+            pyarrow.Table: The table with those columns as strings; missing values stay null.
+        """
+        columns = []
+        for column in table.columns:
+            if pa.types.is_timestamp(column.type):
+                # astype(str) drops the time of day when every timestamp is at midnight, as to_csv does
+                text = pd.DatetimeIndex(column.to_pandas()).astype(str).to_numpy()
+                column = pa.array(text, mask=column.is_null().to_numpy())
+            elif pa.types.is_boolean(column.type):
+                column = pa_compute.if_else(column, 'True', 'False')
+            elif pa.types.is_floating(column.type):
+                values = column.to_numpy()
+                column = pa.array(values.astype(str), mask=np.isnan(values))
+            columns.append(column)
+        return pa.table(columns, names=table.column_names)
+
+    @staticmethod
+    def _row_count(data):
+        """
+        Counts the rows of a list of records or a dictionary of columns.
+
+        Parameters:
+            data (dict | list): The data to be saved.
+
+        Returns:
+            int: The number of rows.
+        """
+        if isinstance(data, list):
+            return len(data)
+        return len(next(iter(data.values()))) if data else 0
+
+    @staticmethod
+    def _format_datetimes(column):
+        """
+        Formats a datetime column the way pandas' to_csv does, leaving any other column as is.
+
+        Parameters:
+            column: The values of the column.
+
+        Returns:
+            The column, as strings if it holds datetimes.
+        """
+        if getattr(column, 'dtype', None) is not None and column.dtype.kind == 'M':
+            return pd.DatetimeIndex(column).astype(str)
+        return column
+
+    def _write_rows(self, data):
+        """
+        Save the data with the csv module, formatting it the way pandas' to_csv does
+        (no index, missing values as empty fields).
+
+        Parameters:
+            data (dict | list): A dictionary of columns or a list of records.
+        """
+        if isinstance(data, list):
+            header = list(dict.fromkeys(key for row in data for key in row))
+            rows = ([row.get(key) for key in header] for row in data)
+        else:
+            header = list(data)
+            rows = zip(*(self._format_datetimes(column) for column in data.values()))
+
+        with open(self.sink, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(header)
+            writer.writerows(['' if value != value else value for value in row] for row in rows)
+
+
+class ParquetDataProducer(DataProducer):
+    """
+    A data producer appending every produced time series to a single Parquet file.
+
+    The file is kept open between calls to produce, so the producer must be closed, either with
+    close() or by using it as a context manager. Requires pyarrow.
+
+    Attributes:
+        sink (str): The destination where data will be produced.
+        writer (pyarrow.parquet.ParquetWriter): The writer of the open Parquet file.
+    """
+
+    def __init__(self, sink: str):
+        """
+        Initialize a ParquetDataProducer instance and open its Parquet file.
+
+        Parameters:
+            sink (str): The destination where data will be produced.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        super().__init__(sink)
+        if pa is None:
+            raise ImportError("pyarrow is required to produce Parquet files")
+
+        self.schema = pa.schema([('id', pa.string()),
+                                 ('timestamp', pa.timestamp('ns')),
+                                 ('value', pa.float32()),
+                                 ('anomaly', pa.bool_())])
+        _create_sink_dir(self.sink)
+        self.writer = pa_parquet.ParquetWriter(self.sink, self.schema)
+
+    def produce(self, data: dict):
+        """
+        Append a time series to the Parquet file.
+
+        Parameters:
+            data (dict): A dictionary with the 'timestamp', 'value' and 'anomaly' columns of the time series,
+            and optionally its 'id', repeated on every row so several series can share the file.
+        """
+        columns = [pa.array(data[field.name], type=field.type, from_pandas=True) for field in list(self.schema)[1:]]
+        series_id = pa.repeat(pa.scalar(data.get('id'), type=pa.string()), len(columns[0]))
+        self.writer.write_table(pa.Table.from_arrays([series_id] + columns, schema=self.schema))
+
+    def close(self):
+        """
+        Close the Parquet file.
+        """
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
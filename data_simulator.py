@@ -1,24 +1,108 @@
+import logging
+import os
 import random
-from sklearn.preprocessing import MinMaxScaler
+from collections import defaultdict, deque
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
+from functools import lru_cache
 
 from abc import ABC, abstractmethod
 
-from itertools import product
+from itertools import chain, product
 
 from configuration_manager import ConfigurationManager
 
+logger = logging.getLogger(__name__)
+
+# the generator shared by DataGenerator instances without a seed of their own and by the component classes,
+# seeded like the random module in time_series_simulator so runs are reproducible
+_RNG = np.random.default_rng(22)
+
+# floating point type of the synthesized series; the output is scaled to [-1, 1] so single precision is enough
+_DTYPE = np.float32
+
+# sinusoid values for every hour of the day, day of the week and quarter (indexed by quarter, 1-4),
+# looked up instead of evaluating np.sin over the whole series
+_SIN_HOUR = np.sin(2 * np.pi * np.arange(24) / 24).astype(_DTYPE)
+_SIN_DAYOFWEEK = np.sin(2 * np.pi * np.arange(7) / 7).astype(_DTYPE)
+_SIN_QUARTER = np.sin(2 * np.pi * (np.arange(5) - 1) / 4).astype(_DTYPE)
+
+
+def _sample_indices(rng, shape, k):
+    """
+    Draw k distinct indices along the last axis of an array, independently for every other axis.
+
+    The indices of the k smallest of a uniform key per element are taken with np.argpartition, so a
+    whole batch of series is sampled in one call.
+
+    Parameters:
+        rng (numpy.random.Generator): The random generator to draw from.
+        shape (int | tuple): The shape of the array.
+        k (int): The number of indices to draw per series.
+
+    Returns:
+        numpy.ndarray: The indices, with shape shape[:-1] + (k,).
+    """
+    keys = rng.random(shape)
+    return np.argpartition(keys, max(k - 1, 0), axis=-1)[..., :k]
+
+
+def _written(results, write):
+    """
+    Hand every series of a batch to write, keeping only its metadata.
+
+    Parameters:
+        results (list): The data and metadata dictionaries described in DataGenerator.generate per series.
+        write (callable | None): Called with the data and metadata dictionaries of every series.
+
+    Returns:
+        list: The metadata dictionary per series, or the results as they are when write is None.
+    """
+    if write is None:
+        return results
+
+    for data, meta_data_point in results:
+        write(data, meta_data_point)
+    return [meta_data_point for _, meta_data_point in results]
+
+
+def _synthesize_seeded(start_date, max_data_size, tasks, seed, write=None):
+    """
+    Generate the time series of one combination of configuration options in a worker process.
+
+    Only the values the batch needs are passed, so the DataGenerator is not pickled for every batch.
+    The random generators are seeded from the batch's seed first, so workers forked from the same parent
+    do not draw the same random numbers and a seeded run stays reproducible.
+
+    Parameters:
+        start_date (datetime.datetime): The start date of every series.
+        max_data_size (int): The longest data size, whose time index the shorter ones are sliced from.
+        tasks (list): The series parameters as returned by DataGenerator._task_batches.
+        seed (numpy.random.SeedSequence): The seed of the batch.
+        write (callable | None): Passed on to _written.
+
+    Returns:
+        list: The results of the batch, in order, as returned by _written.
+    """
+    random.seed(int(seed.generate_state(1)[0]))
+    return _written(DataGenerator._synthesize_batch(start_date, max_data_size, tasks, np.random.default_rng(seed)),
+                    write)
+
 
 class DataGenerator:
-    def __init__(self, configuration_manager: ConfigurationManager):
+    def __init__(self, configuration_manager: ConfigurationManager, n_jobs=1, seed=None):
         """
         This class initializes its attributes based on the provided ConfigurationManager.
 
         Parameters:
                 configuration_manager (ConfigurationManager): An instance of ConfigurationManager
                 that holds various configuration parameters.
+                n_jobs (int | None): The number of worker processes generating series. 1 generates them
+                in the calling process and None uses one process per CPU.
+                seed (int | None): Seed of the random generator used for noise, outliers and missing values.
+                None uses the module's shared generator.
 
         Attributes:
             start_date (datetime.datetime): The start date for data generation.
@@ -31,6 +115,9 @@ class DataGenerator:
             data_types (List[str]): A list of data types.
             percentage_outliers_options (List[...]): A list of percentage outliers options.
             data_sizes (List[...]): A list of data sizes.
+            n_jobs (int | None): The number of worker processes.
+            rng (numpy.random.Generator): The random generator used for noise, outliers and missing values.
+            task_batches (list): The parameters of every series to generate, as returned by _task_batches.
         """
         self.start_date = configuration_manager.start_date
         self.frequencies = configuration_manager.frequencies
@@ -42,6 +129,16 @@ class DataGenerator:
         self.data_types = configuration_manager.data_types
         self.percentage_outliers_options = configuration_manager.percentage_outliers_options
         self.data_sizes = configuration_manager.data_sizes
+        self.n_jobs = n_jobs
+        self.rng = _RNG if seed is None else np.random.default_rng(seed)
+        self.task_batches = self._task_batches()
+
+    def __len__(self):
+        """
+        return:
+            The number of series generated
+        """
+        return sum(len(tasks) for tasks in self.task_batches)
 
     def generate(self):
         """
@@ -57,8 +154,69 @@ class DataGenerator:
             - The second dictionary includes metadata such as 'id', 'data_type', 'daily_seasonality',
                 'weekly_seasonality', 'noise (high 30% - low 10%)', 'trend', 'cyclic_period (3 months)',
                 'data_size', 'percentage_outliers', 'percentage_missing', and 'freq'.
+
+        Unless n_jobs is 1 the series are generated in worker processes; they are still yielded in order.
+        """
+        yield from chain.from_iterable(self._batch_results(None))
+
+    def produce(self, write):
+        """
+        Generate the time series like generate, handing every series to write in the process that generated it.
+
+        Unless n_jobs is 1 the series are written by the worker processes, so only their metadata is sent
+        back instead of the whole series.
+
+        Parameters:
+            write (callable): Called with the data and metadata dictionaries of every series. It is sent to the
+            worker processes, so unless n_jobs is 1 it must be picklable, such as a module-level function.
+
+        Yields:
+            The metadata dictionary of every series, in order.
+        """
+        yield from chain.from_iterable(self._batch_results(write))
+
+    def _batch_results(self, write):
+        """
+        Generate the task batches in order, in this process when n_jobs is 1 and in worker processes otherwise.
+
+        At most two batches per worker are in flight, so results that were not consumed yet do not pile up.
+
+        Parameters:
+            write (callable | None): Passed on to _written.
+
+        Yields:
+            list: The results of a batch, as returned by _written.
         """
+        max_data_size = max(self.data_sizes)
+        if self.n_jobs == 1:
+            for tasks in self._logged_task_batches():
+                yield _written(self._synthesize_batch(self.start_date, max_data_size, tasks, self.rng), write)
+            return
+
+        seeds = np.random.SeedSequence(int(self.rng.integers(2 ** 63))).spawn(len(self.task_batches))
+        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+            # only the start date, the longest data size and the batch are sent to the workers, not the generator
+            pending = deque()
+            for tasks, seed in zip(self._logged_task_batches(), seeds):
+                if len(pending) == 2 * (self.n_jobs or os.cpu_count() or 1):
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_synthesize_seeded, self.start_date, max_data_size, tasks, seed,
+                                               write))
+            while pending:
+                yield pending.popleft().result()
+
+    def _task_batches(self):
+        """
+        Draw the parameters of every series to generate, batched per combination of configuration options.
+
+        Every combination of the configuration options is repeated 16 times, each time with a
+        randomly chosen data size and frequency.
 
+        Returns:
+            list: A list per combination, with a tuple (counter, configs, data_size, freq) per repeat, where configs
+            holds the daily seasonality, weekly seasonality, noise level, trend, cyclic period, percentage of
+            outliers and data type.
+        """
         config_params = [
             self.daily_seasonality_options,
             self.weekly_seasonality_options,
@@ -69,64 +227,230 @@ class DataGenerator:
             self.data_types,
         ]
 
-        counter = 0
         #used the itertools.product to make all the combinations without the need of nested for loops
-        for configs in product(*config_params):
-            daily_seasonality, weekly_seasonality, noise_level, trend, cyclic_period, percentage_outliers, data_type = configs
-
-            for _ in range(16):
-                data_size = random.choice(self.data_sizes)
-                freq = random.choice(self.frequencies)
-                counter += 1
-                file_name = f"TimeSeries_daily_{daily_seasonality}_weekly_{weekly_seasonality}_noise_{noise_level}_trend_{trend}_cycle_{cyclic_period}_outliers_{int(percentage_outliers * 100)}%_freq_{freq}_size_{data_size}Days.csv"
-                print(f"File '{file_name}' generated.")
-
-                date_rng = TimeSeriesGenerator.generate_time_series(self.start_date,
-                                                                    self.start_date + timedelta(days=data_size),
-                                                                    freq)
-
-                daily_seasonality_instance = DailySeasonality()
-                daily_seasonal_component = daily_seasonality_instance.add_seasonality(date_rng, daily_seasonality,
-                                                                                      season_type=data_type)
-
-                weekly_seasonality_instance = WeeklySeasonality()
-                weekly_seasonal_component = weekly_seasonality_instance.add_seasonality(date_rng, weekly_seasonality,
-                                                                                        season_type=data_type)
-
-                trend_component = Trend.add_trend(date_rng, trend, data_size=data_size, data_type=data_type)
-                cyclic_period = "exist"
-                cyclic_component = Cycles.add_cycles(date_rng, cyclic_period, season_type=data_type)
-
-                if data_type == 'multiplicative':
-                    data = daily_seasonal_component * weekly_seasonal_component * trend_component * cyclic_component
-                else:
-                    data = daily_seasonal_component + weekly_seasonal_component + trend_component + cyclic_component
-
-                scaler = MinMaxScaler(feature_range=(-1, 1))
-                data = scaler.fit_transform(data.values.reshape(-1, 1))
-                data = Noise.add_noise(data, noise_level)
-                data, anomaly = Outliers.add_outliers(data, percentage_outliers)
-                data = MissingValues.add_missing_values(data, 0.05)
-
-                yield ({'value': data, 'timestamp': date_rng, 'anomaly': anomaly},
-                       {'id': str(counter) + '.csv',
-                        'data_type': data_type,
-                        'daily_seasonality': daily_seasonality,
-                        'weekly_seasonality': weekly_seasonality,
-                        'noise (high 30% - low 10%)': noise_level,
-                        'trend': trend,
-                        'cyclic_period (3 months)': cyclic_period,
-                        'data_size': data_size,
-                        'percentage_outliers': percentage_outliers,
-                        'percentage_missing': 0.05,
-                        'freq': freq})
+        combinations = product(*config_params)
+        return [[(16 * batch + repeat + 1, configs, random.choice(self.data_sizes), random.choice(self.frequencies))
+                 for repeat in range(16)]
+                for batch, configs in enumerate(combinations)]
+
+    def _logged_task_batches(self):
+        """
+        Yield the task batches, logging the file name of every series in a batch before it is generated.
+
+        Yields:
+            A list of series parameters, as returned by _task_batches.
+        """
+        for tasks in self.task_batches:
+            if logger.isEnabledFor(logging.INFO):
+                for _, configs, data_size, freq in tasks:
+                    daily_seasonality, weekly_seasonality, noise_level, trend, cyclic_period, percentage_outliers, _ = configs
+                    file_name = f"TimeSeries_daily_{daily_seasonality}_weekly_{weekly_seasonality}_noise_{noise_level}_trend_{trend}_cycle_{cyclic_period}_outliers_{int(percentage_outliers * 100)}%_freq_{freq}_size_{data_size}Days.csv"
+                    logger.info("File '%s' generated.", file_name)
+
+            yield tasks
+
+    @staticmethod
+    def _synthesize_batch(start_date, max_data_size, tasks, rng):
+        """
+        Generate the time series of one combination of configuration options.
+
+        Repeats that drew the same data size and frequency share a time index and are synthesized
+        together as one 2-D array.
+
+        Parameters:
+            start_date (datetime.datetime): The start date of every series.
+            max_data_size (int): The longest data size, whose time index the shorter ones are sliced from.
+            tasks (list): The series parameters as returned by _task_batches.
+            rng (numpy.random.Generator): The random generator used for noise, outliers and missing values.
+
+        Returns:
+            list: A tuple of the data and metadata dictionaries described in generate per task, in order.
+        """
+        groups = defaultdict(list)
+        for position, (_, _, data_size, freq) in enumerate(tasks):
+            groups[data_size, freq].append(position)
+
+        results = [None] * len(tasks)
+        for positions in groups.values():
+            group_results = DataGenerator._synthesize_group(start_date, max_data_size,
+                                                            [tasks[position] for position in positions], rng)
+            for position, result in zip(positions, group_results):
+                results[position] = result
+        return results
+
+    @staticmethod
+    def _synthesize_group(start_date, max_data_size, tasks, rng):
+        """
+        Generate time series sharing their configuration options, data size and frequency.
+
+        The seasonal and cyclic components are computed once, and the noise, outliers and missing values
+        of all the series are drawn in a single call each. Only the trend slope is drawn per series.
+
+        Parameters:
+            start_date (datetime.datetime): The start date of every series.
+            max_data_size (int): The longest data size, whose time index the shorter ones are sliced from.
+            tasks (list): The series parameters, all with the same configs, data_size and freq.
+            rng (numpy.random.Generator): The random generator used for noise, outliers and missing values.
+
+        Returns:
+            list: A tuple of the data and metadata dictionaries described in generate per task.
+        """
+        _, configs, data_size, freq = tasks[0]
+        daily_seasonality, weekly_seasonality, noise_level, trend, cyclic_period, percentage_outliers, data_type = configs
+
+        time_components = TimeSeriesGenerator.time_components(start_date,
+                                                              start_date + timedelta(days=data_size),
+                                                              freq,
+                                                              start_date + timedelta(days=max_data_size))
+        date_rng = time_components.index
+
+        cyclic_period = "exist"
+        seasonal_component = DataGenerator._seasonal_component(time_components, daily_seasonality, weekly_seasonality,
+                                                      cyclic_period, data_type)
+
+        # the series only differ in the slope of their trend before noise, so each distinct slope is combined
+        # and scaled once, then copied
+        data = np.empty((len(tasks), len(time_components)), dtype=_DTYPE)
+        scaled_series = {}
+        for series in data:
+            slope = Trend.random_slope() if trend == "exist" else None
+            if slope not in scaled_series:
+                trend_component = Trend.add_trend(time_components, trend, data_size=data_size, data_type=data_type,
+                                                  slope=slope)
+                DataGenerator._combine((seasonal_component, trend_component), data_type, series)
+                scaled_series[slope] = DataGenerator._scale(series)
+            else:
+                series[...] = scaled_series[slope]
+
+        data = Noise.add_noise(data, noise_level, rng=rng).reshape(data.shape)
+        anomalies = DataGenerator._finalize(data, percentage_outliers, 0.05, rng)
+
+        results = []
+        for (counter, _, _, _), values, anomaly in zip(tasks, data, anomalies):
+            results.append(({'value': values, 'timestamp': date_rng, 'anomaly': anomaly},
+                            {'id': str(counter),
+                             'data_type': data_type,
+                             'daily_seasonality': daily_seasonality,
+                             'weekly_seasonality': weekly_seasonality,
+                             'noise (high 30% - low 10%)': noise_level,
+                             'trend': trend,
+                             'cyclic_period (3 months)': cyclic_period,
+                             'data_size': data_size,
+                             'percentage_outliers': percentage_outliers,
+                             'percentage_missing': 0.05,
+                             'freq': freq}))
+        return results
+
+    @staticmethod
+    def _finalize(data, percentage_outliers, percentage_missing, rng):
+        """
+        Add the outliers and then the missing values to a batch of noisy series, in place.
+
+        Both are written straight into the batch instead of each step copying every series, and the
+        positions and outlier values of the whole batch are drawn in a single call each.
+
+        Parameters:
+            data (numpy.ndarray): The noisy series, one per row.
+            percentage_outliers (float): The percentage of outliers to add (e.g., 0.2 for 20%).
+            percentage_missing (float): The percentage of missing values to add.
+            rng (numpy.random.Generator): The random generator the positions and outlier values are drawn from.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the outlier positions, one row per series.
+        """
+        num_series, size = data.shape
+        num_outliers = int(size * percentage_outliers)
+        num_missing = int(size * percentage_missing)
+
+        outlier_indices = _sample_indices(rng, data.shape, num_outliers)
+        outlier_values = rng.uniform(-1, 1, (num_series, num_outliers)).astype(data.dtype, copy=False)
+        np.put_along_axis(data, outlier_indices, outlier_values, axis=-1)
+
+        anomalies = np.zeros(data.shape, dtype=bool)
+        np.put_along_axis(anomalies, outlier_indices, True, axis=-1)
+
+        np.put_along_axis(data, _sample_indices(rng, data.shape, num_missing), np.nan, axis=-1)
+        return anomalies
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _seasonal_component(time_components, daily_seasonality, weekly_seasonality, cyclic_period, data_type):
+        """
+        Combine the daily, weekly and cyclic components of a time index, cached per time index and options
+        since every combination of the other configuration options shares them.
+
+        Parameters:
+            time_components (TimeComponents): The time index, as cached by TimeSeriesGenerator.time_components.
+            daily_seasonality (str): The daily seasonality option.
+            weekly_seasonality (str): The weekly seasonality option.
+            cyclic_period (str): The cyclic period option.
+            data_type (str): 'multiplicative' or 'additive'.
+
+        Returns:
+            numpy.ndarray: The read-only seasonal component.
+        """
+        daily_seasonal_component = DailySeasonality().add_seasonality(time_components, daily_seasonality,
+                                                                      season_type=data_type)
+        weekly_seasonal_component = WeeklySeasonality().add_seasonality(time_components, weekly_seasonality,
+                                                                        season_type=data_type)
+        cyclic_component = Cycles.add_cycles(time_components, cyclic_period, season_type=data_type)
+
+        seasonal_component = DataGenerator._combine(
+            (daily_seasonal_component, weekly_seasonal_component, cyclic_component),
+            data_type, np.empty(len(time_components), dtype=_DTYPE))
+        seasonal_component.flags.writeable = False
+        return seasonal_component
+
+    @staticmethod
+    def _combine(components, data_type, out):
+        """
+        Combine the time series components into a single array.
+
+        The components are multiplied for multiplicative data and added otherwise, accumulating
+        in place into the output buffer instead of materializing an intermediate array per operation.
+
+        Parameters:
+            components (tuple): The components, as arrays or scalars broadcast over the series.
+            data_type (str): 'multiplicative' or 'additive'.
+            out (numpy.ndarray): The buffer receiving the combined series.
+
+        Returns:
+            numpy.ndarray: The combined series.
+        """
+        combine = np.multiply if data_type == 'multiplicative' else np.add
+        out[...] = components[0]
+        for component in components[1:]:
+            combine(out, np.asarray(component), out=out)
+        return out
+
+    @staticmethod
+    def _scale(data):
+        """
+        Min-max scale every series (the last axis) to [-1, 1] in place.
+
+        A constant series maps to -1, like sklearn's MinMaxScaler(feature_range=(-1, 1)) does.
+
+        Parameters:
+            data (numpy.ndarray): The series.
+
+        Returns:
+            numpy.ndarray: The scaled series.
+        """
+        data_min = data.min(axis=-1, keepdims=True)
+        data_range = data.max(axis=-1, keepdims=True) - data_min
+        data -= data_min
+        data *= 2 / np.where(data_range == 0, 1, data_range)
+        data -= 1
+        return data
 
 
 class TimeSeriesGenerator:
     @staticmethod
+    @lru_cache(maxsize=64)
     def generate_time_series(start_date, end_date, freq):
         """
-        Generate a time index (DatetimeIndex) with the specified frequency.
+        Generate a time index (DatetimeIndex) with the specified frequency, cached per (start_date, end_date, freq).
+        The index is immutable, so the cached one is shared by every caller.
 
         Parameters:
             start_date (datetime): The start date of the time index.
@@ -139,6 +463,77 @@ class TimeSeriesGenerator:
         date_rng = pd.date_range(start=start_date, end=end_date, freq=freq)
         return date_rng
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def time_components(start_date, end_date, freq, base_end_date=None):
+        """
+        Generate a time index and extract its calendar fields, cached per (start_date, end_date, freq).
+
+        When base_end_date is later than end_date, the index is sliced out of the (cached) one ending at
+        base_end_date, so indexes of different lengths sharing a start date and frequency are built from
+        a single pd.date_range.
+
+        Parameters:
+            start_date (datetime): The start date of the time index.
+            end_date (datetime): The end date of the time index.
+            freq (str): The frequency for the time index.
+            base_end_date (datetime | None): The end date of the longest index generated with this frequency.
+
+        Returns:
+            TimeComponents: The time index with its hour, day of week and quarter arrays.
+        """
+        if base_end_date is None or base_end_date <= end_date:
+            return TimeComponents(TimeSeriesGenerator.generate_time_series(start_date, end_date, freq))
+
+        base = TimeSeriesGenerator.time_components(start_date, base_end_date, freq)
+        return base.head(base.index.searchsorted(pd.Timestamp(end_date), side='right'))
+
+
+class TimeComponents:
+    """
+    The calendar fields of a time index, extracted once so the component builders do not go through
+    the pandas accessors on every call. It exposes the same 'hour', 'dayofweek' and 'quarter'
+    attributes as a DatetimeIndex, so either can be passed to the component builders.
+
+    The arrays are read-only because instances are shared through the TimeSeriesGenerator cache.
+    """
+
+    def __init__(self, index):
+        """
+        Parameters:
+            index (DatetimeIndex): The time index.
+        """
+        self.index = index
+        self.hour = self._read_only(index.hour)
+        self.dayofweek = self._read_only(index.dayofweek)
+        self.quarter = self._read_only(index.quarter)
+
+    def __len__(self):
+        return len(self.index)
+
+    def head(self, n):
+        """
+        Gets the first n points of the time index.
+
+        Parameters:
+            n (int): The number of points.
+
+        Returns:
+            TimeComponents: The components of the shortened index, sharing this instance's arrays.
+        """
+        components = TimeComponents.__new__(TimeComponents)
+        components.index = self.index[:n]
+        components.hour = self.hour[:n]
+        components.dayofweek = self.dayofweek[:n]
+        components.quarter = self.quarter[:n]
+        return components
+
+    @staticmethod
+    def _read_only(field):
+        values = np.asarray(field, dtype=np.int16)
+        values.flags.writeable = False
+        return values
+
 
 class Seasonality(ABC):
     """
@@ -159,20 +554,20 @@ class WeeklySeasonality(Seasonality):
         Add weekly seasonality component to the time series data.
 
         Parameters:
-            data (DatetimeIndex): The time index for the data.
+            data (DatetimeIndex | TimeComponents): The time index for the data.
             seasonality (str): The type of seasonality ('Long', 'Short', or 'Intermediate').
             season_type
 
         Returns:
-            numpy.ndarray: The seasonal component of the time series.
+            numpy.ndarray | int: The seasonal component of the time series, or 0 (additive) / 1 when there is none.
 
         """
         if seasonality == "exist":  # Weekly Seasonality
-            seasonal_component = np.sin(2 * np.pi * data.dayofweek / 7)
+            seasonal_component = np.take(_SIN_DAYOFWEEK, data.dayofweek)
             seasonal_component += 1 if season_type == 'multiplicative' else 0
-        else:
-            seasonal_component = np.zeros(len(data)) if season_type == 'additive' else np.ones(len(data))
-        return pd.Series(seasonal_component)
+        else:  # constant identity, broadcast when the components are combined
+            seasonal_component = 0 if season_type == 'additive' else 1
+        return seasonal_component
 
 
 class DailySeasonality(Seasonality):
@@ -182,41 +577,73 @@ class DailySeasonality(Seasonality):
         Add daily seasonality component to the time series data.
 
         Parameters:
-            data (DatetimeIndex): The time index for the data.
+            data (DatetimeIndex | TimeComponents): The time index for the data.
             seasonality (str): The type of seasonality ('Long', 'Short', or 'Intermediate').
 
         Returns:
-            numpy.ndarray: The seasonal component of the time series.
+            numpy.ndarray | int: The seasonal component of the time series, or 0 (additive) / 1 when there is none.
         """
         if seasonality == "exist":  # Daily Seasonality
-            seasonal_component = np.sin(2 * np.pi * data.hour / 24)
+            seasonal_component = np.take(_SIN_HOUR, data.hour)
             seasonal_component += 1 if season_type == 'multiplicative' else 0
-        else:
-            seasonal_component = np.zeros(len(data)) if season_type == 'additive' else np.ones(len(data))
-        return pd.Series(seasonal_component)
+        else:  # constant identity, broadcast when the components are combined
+            seasonal_component = 0 if season_type == 'additive' else 1
+        return seasonal_component
 
 
 class Trend:
     @staticmethod
-    def add_trend(data, trend, data_size, data_type):
+    def add_trend(data, trend, data_size, data_type, slope=None):
         """
         Add trend component to the time series data.
 
         Parameters:
-            data (DatetimeIndex): The time index for the data.
+            data (DatetimeIndex | TimeComponents): The time index for the data.
             trend (str): The magnitude of the trend ('No Trend', 'exist').
+            slope (int | None): 1 or -1, drawn with random_slope when None.
 
         Returns:
-            numpy.ndarray: The trend component of the time series.
+            numpy.ndarray | int: The read-only trend component of the time series, or 0 (additive) / 1 when
+            there is none.
         """
         if trend == "exist":
-            slope = random.choice([1, -1])
-            trend_component = np.linspace(0, data_size / 30 * slope, len(data)) if slope == 1 else np.linspace(
-                -1 * data_size / 30, 0, len(data))
+            if slope is None:
+                slope = Trend.random_slope()
+            trend_component = Trend._slope(len(data), data_size, slope)
         else:  # No Trend
-            trend_component = np.zeros(len(data)) if data_type == 'additive' else np.ones(len(data))
+            trend_component = 0 if data_type == 'additive' else 1
+
+        return trend_component
+
+    @staticmethod
+    def random_slope():
+        """
+        Draw the direction of a trend.
+
+        Returns:
+            int: 1 or -1.
+        """
+        return random.choice([1, -1])
 
-        return pd.Series(trend_component)
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _slope(size, data_size, slope):
+        """
+        Get a read-only linear trend starting at 0 or ending at 0, cached per length, data size and slope.
+
+        Parameters:
+            size (int): The number of points.
+            data_size (int): The number of days of the series, setting the amplitude of the trend.
+            slope (int): 1 for a trend starting at 0, -1 for one ending at 0.
+
+        Returns:
+            numpy.ndarray: The trend.
+        """
+        amplitude = data_size / 30
+        start = 0 if slope == 1 else -amplitude
+        trend_component = np.linspace(start, start + amplitude, size, dtype=_DTYPE)
+        trend_component.flags.writeable = False
+        return trend_component
 
 
 class Cycles:
@@ -226,15 +653,15 @@ class Cycles:
         Add cyclic component to the time series data.
 
         Parameters:
-            data (DatetimeIndex): The time index for the data.
+            data (DatetimeIndex | TimeComponents): The time index for the data.
             cyclic_periods (str): The type of cyclic periods ('No Cyclic Periods', 'Short Cycles', or 'Long Cycles').
 
         Returns:
-            numpy.ndarray: The cyclic component of the time series.
+            numpy.ndarray | int: The cyclic component of the time series, or 0 (additive) / 1 when there is none.
         """
         if cyclic_periods == "exist":  # Quarterly
             cycle_component = 1 if season_type == 'multiplicative' else 0
-            cycle_component += np.sin(2 * np.pi * (data.quarter - 1) / 4)
+            cycle_component += np.take(_SIN_QUARTER, data.quarter)
         else:  # No Cyclic Periods
             cycle_component = 0 if season_type == 'additive' else 1
 
@@ -243,21 +670,24 @@ class Cycles:
 
 class MissingValues:
     @staticmethod
-    def add_missing_values(data, percentage_missing=0.05):
+    def add_missing_values(data, percentage_missing=0.05, rng=None, inplace=False):
         """
         Add missing values to the time series data within a specified date range.
 
         Parameters:
             data (numpy.ndarray): The time series data.
             percentage_missing (Float): percentage of missing value.
+            rng (numpy.random.Generator): The random generator to draw from, the module's shared one by default.
+            inplace (bool): Write the missing values into data instead of a copy of it.
 
         Returns:
             numpy.ndarray: The time series data with missing values.
         """
         num_missing = int(len(data) * percentage_missing)
-        missing_indices = np.random.choice(len(data), size=num_missing, replace=False)
+        rng = _RNG if rng is None else rng
+        missing_indices = _sample_indices(rng, len(data), num_missing)
 
-        data_with_missing = data.copy()
+        data_with_missing = data if inplace else data.copy()
         data_with_missing[missing_indices] = np.nan
 
         return data_with_missing
@@ -265,16 +695,17 @@ class MissingValues:
 
 class Noise:
     @staticmethod
-    def add_noise(data, noise_level):
+    def add_noise(data, noise_level, rng=None):
         """
         Add noise component to the time series data.
 
         Parameters:
-            data (DatetimeIndex): The time index for the data.
+            data (numpy.ndarray): The time series data.
             noise_level (str): The magnitude of noise ('No Noise', 'Small Noise', 'Intermediate Noise', 'Large Noise').
+            rng (numpy.random.Generator): The random generator to draw from, the module's shared one by default.
 
         Returns:
-            numpy.ndarray: The noise component of the time series.
+            numpy.ndarray: The 1-D float32 time series with the noise added.
         """
         if noise_level == "small":
             noise_level = 0.1
@@ -285,34 +716,41 @@ class Noise:
         else:  # No Noise
             noise_level = 0
 
-        noise = np.zeros_like(data)
-        for i in range(len(data)):
-            noise[i] = np.random.normal(0, abs(data[i]) * noise_level) if noise_level > 0 else 0
-        return pd.Series((data + noise)[:, 0])
+        data = np.ascontiguousarray(data, dtype=_DTYPE).ravel()
+        if noise_level == 0:
+            return data
+
+        # accumulate into one buffer: |data| * level * N(0, 1) + data, without an intermediate per operation
+        rng = _RNG if rng is None else rng
+        noisy = np.abs(data)
+        noisy *= _DTYPE(noise_level)
+        noisy *= rng.standard_normal(data.shape, dtype=_DTYPE)
+        noisy += data
+        return noisy
 
 
 class Outliers:
     @staticmethod
-    def add_outliers(data, percentage_outliers=0.05):
+    def add_outliers(data, percentage_outliers=0.05, rng=None, inplace=False):
         """
         Add outliers to the time series data.
 
         Parameters:
             data (numpy.ndarray): The time series data.
             percentage_outliers (float): The percentage of outliers to add (e.g., 0.2 for 20%).
+            rng (numpy.random.Generator): The random generator to draw from, the module's shared one by default.
+            inplace (bool): Write the outliers into data instead of a copy of it.
 
         Returns:
-            numpy.ndarray: The time series data with outliers.
+            tuple: The time series data with outliers and the boolean mask of the outlier positions.
         """
-        # data = pd.Series(data)
         num_outliers = int(len(data) * percentage_outliers)
-        outlier_indices = np.random.choice(len(data), num_outliers, replace=False)
-        # data_with_outliers = pd.Series(data.copy())
-        data_with_outliers = data.copy()
-        outliers = np.random.uniform(-1, 1, num_outliers)
-        anomaly_mask = np.zeros(len(data_with_outliers), dtype=bool)
-        if len(outliers) > 0:
-            data_with_outliers[outlier_indices] = outliers
-            anomaly_mask[outlier_indices] = True
+        rng = _RNG if rng is None else rng
+        outlier_indices = _sample_indices(rng, len(data), num_outliers)
+
+        anomaly_mask = np.zeros(len(data), dtype=bool)
+        anomaly_mask[outlier_indices] = True
+        data_with_outliers = data if inplace else data.copy()
+        data_with_outliers[outlier_indices] = rng.uniform(-1, 1, num_outliers).astype(data.dtype, copy=False)
 
         return data_with_outliers, anomaly_mask
\ No newline at end of file
@@ -1,4 +1,6 @@
+import logging
 import random
+from contextlib import ExitStack
 
 from configuration_manager import ConfigurationManagerCreator
 from data_simulator import DataGenerator
@@ -7,15 +9,53 @@ from data_producer import DataProducerFileCreation
 random.seed(22)
 
 
-def main():
+def _write_csv(data, meta_data_point):
+    """
+    Write a time series to the CSV file named after its id, in the process that generated it.
+
+    Parameters:
+        data (dict): The data dictionary of the series.
+        meta_data_point (dict): The metadata dictionary of the series.
+    """
+    DataProducerFileCreation.create(f"sample_datasets/{meta_data_point['id']}.csv").produce(data)
+
+
+def main(sink_format="csv", n_jobs=None):
+    """
+    Generate the sample datasets and their meta data.
+
+    Parameters:
+        sink_format (str): 'csv' writes one file per series, 'parquet' appends the series sharing a
+        frequency and data size to one Parquet file, with the series id on every row. CSV files are named
+        after the series id, and that file name is the id written to the meta data.
+        n_jobs (int | None): The number of worker processes generating series. By default CSV files are
+        generated and written by one process per CPU, while Parquet datasets are generated in this process
+        since every series of a bucket is appended to a file opened here.
+    """
+    logging.basicConfig(level=logging.WARNING)
+
+    if n_jobs is None and sink_format == "parquet":
+        n_jobs = 1
+
     configuration_manager = ConfigurationManagerCreator.create("example.yml", None)
-    data_simulator = DataGenerator(configuration_manager)
+    data_simulator = DataGenerator(configuration_manager, n_jobs=n_jobs)
     meta_data_producer = DataProducerFileCreation.create('sample_datasets/meta_data.csv')
 
-    meta_data = []
-    for (data, meta_data_point) in data_simulator.generate():
-        DataProducerFileCreation.create(f"sample_datasets/{meta_data_point['id']}").produce(data)
-        meta_data.append(meta_data_point)
+    if sink_format == "parquet":
+        meta_data = []
+        with ExitStack() as stack:
+            bucket_producers = {}
+            for (data, meta_data_point) in data_simulator.generate():
+                bucket = (meta_data_point['freq'], meta_data_point['data_size'])
+                if bucket not in bucket_producers:
+                    bucket_producers[bucket] = stack.enter_context(DataProducerFileCreation.create(
+                        f"sample_datasets/TimeSeries_freq_{bucket[0]}_size_{bucket[1]}Days.parquet"))
+                bucket_producers[bucket].produce({**data, 'id': meta_data_point['id']})
+                meta_data.append(meta_data_point)
+    else:
+        # the workers write the series themselves and only send their metadata back
+        meta_data = [{**meta_data_point, 'id': f"{meta_data_point['id']}.csv"}
+                     for meta_data_point in data_simulator.produce(_write_csv)]
 
     meta_data_producer.produce(meta_data)
 